@@ -1,6 +1,12 @@
+from cachetools import TTLCache
+from concurrent.futures import ProcessPoolExecutor
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
+import asyncio
+import json
+import logging
+import os
 import uvicorn
 
 # Import services
@@ -9,16 +15,30 @@ from app.services.ui.theme_manager import ThemeManager
 from app.services.project.project_manager import ProjectManager
 from app.services.collaboration.realtime_service import RealtimeCollaborationService
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="AI Coworker API",
     description="API for AI-powered coworker application",
     version="1.0.0"
 )
 
-# Configure CORS
+# Configure CORS. Production only accepts the comma-separated ALLOWED_ORIGINS;
+# a frozenset keeps the per-request origin check a hash lookup.
+if os.environ.get("ENV") == "production":
+    allowed_origins = frozenset(
+        origin.strip()
+        for origin in os.environ.get("ALLOWED_ORIGINS", "").split(",")
+        if origin.strip()
+    )
+    if not allowed_origins:
+        raise RuntimeError("ALLOWED_ORIGINS must list at least one origin when ENV=production")
+else:
+    allowed_origins = ["*"]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with actual origins
+    allow_origins=allowed_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -27,10 +47,30 @@ app.add_middleware(
 # Initialize services
 BASE_DIR = Path(__file__).resolve().parent.parent
 ui_generator = UIGenerator()
-theme_manager = ThemeManager(str(BASE_DIR / "themes"))
+theme_manager = ThemeManager(str(BASE_DIR / "themes"), autoload=False)
 project_manager = ProjectManager(str(BASE_DIR / "projects"))
 realtime_service = RealtimeCollaborationService("your-jwt-secret")  # Replace with actual secret
 
+# Read theme files concurrently at startup instead of serially at import
+@app.on_event("startup")
+async def load_themes():
+    await theme_manager.load_themes_async()
+
+# Component generation is CPU-bound; run it off the event loop so it
+# doesn't stall WebSocket traffic
+@app.on_event("startup")
+async def start_generation_pool():
+    max_workers = int(os.environ.get("GENERATION_WORKERS", os.cpu_count() or 1))
+    app.state.pool = ProcessPoolExecutor(max_workers=max_workers)
+
+@app.on_event("shutdown")
+async def stop_generation_pool():
+    app.state.pool.shutdown()
+
+# Generated code is a pure function of the request. The cache is per
+# process; the TTL only bounds how long an entry lives here.
+_component_cache = TTLCache(maxsize=1024, ttl=300)
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to AI Coworker API"}
@@ -47,8 +87,16 @@ async def websocket_endpoint(websocket: WebSocket, project_id: str):
 # UI Framework endpoints
 @app.post("/api/generate-component")
 async def generate_component(framework: UIFramework, component_def: dict):
+    key = (framework, json.dumps(component_def, sort_keys=True))
+    code = _component_cache.get(key)
+    if code is None:
+        loop = asyncio.get_running_loop()
+        code = await loop.run_in_executor(
+            app.state.pool, ui_generator.generate_component, component_def, framework
+        )
+        _component_cache[key] = code
     return {
-        "code": ui_generator.generate_component(component_def, framework)
+        "code": code
     }
 
 # Theme management endpoints
@@ -74,4 +122,25 @@ async def get_project(project_id: str):
     return project_manager.get_project(project_id)
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # Themes, the component cache and collaboration sessions live in each
+    # process, so extra workers would serve diverging state. Keep one worker
+    # until that state is shared.
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    if workers > 1:
+        logger.warning(
+            "Running %d workers: theme changes and collaboration sessions "
+            "are not shared between them",
+            workers
+        )
+
+    # Multiple workers need an import string so each process can load the
+    # app; a single worker serves this module's app without re-importing it
+    uvicorn.run(
+        "app.main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8080,
+        workers=workers,
+        loop="auto",  # uvloop when installed
+        http="auto",  # httptools when installed
+        ws="auto"
+    )
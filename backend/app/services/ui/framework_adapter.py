@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple, Type
+import hashlib
 import json
+import os
+import stat
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 class UIFramework(Enum):
     REACT = "react"
@@ -10,18 +16,176 @@ class UIFramework(Enum):
     SVELTE = "svelte"
     NEXTJS = "nextjs"
 
-@dataclass
+# Templates are compiled once per process; the bytecode cache lets later
+# processes skip compilation entirely. In production, template lookups skip
+# the stat() call that checks the source for changes.
+_TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+_PRODUCTION = os.environ.get("ENV") == "production"
+
+def _bytecode_cache() -> FileSystemBytecodeCache:
+    """Bytecode cache in JINJA_CACHE, or Jinja's private per-user temp dir"""
+    cache_dir = os.environ.get("JINJA_CACHE")
+    if not cache_dir:
+        return FileSystemBytecodeCache()
+
+    # Cached bytecode is executed when loaded, so refuse a directory anyone
+    # but us could write to. Existing directories are checked, never chmod'ed.
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    if os.name == "posix":
+        info = os.lstat(cache_dir)
+        if (
+            not stat.S_ISDIR(info.st_mode)
+            or info.st_uid != os.getuid()
+            or info.st_mode & 0o077
+        ):
+            raise RuntimeError(
+                f"JINJA_CACHE directory '{cache_dir}' must be a directory owned "
+                f"by the current user with mode 0700"
+            )
+    return FileSystemBytecodeCache(cache_dir)
+
+_ENV = Environment(
+    loader=FileSystemLoader(str(_TEMPLATES_DIR)),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+    auto_reload=not _PRODUCTION,
+    bytecode_cache=_bytecode_cache()
+)
+
+# Framework config files are constant, so they are serialized once at import
+_REACT_TSCONFIG = json.dumps({
+    "compilerOptions": {
+        "target": "es5",
+        "lib": ["dom", "dom.iterable", "esnext"],
+        "allowJs": True,
+        "skipLibCheck": True,
+        "esModuleInterop": True,
+        "allowSyntheticDefaultImports": True,
+        "strict": True,
+        "forceConsistentCasingInFileNames": True,
+        "module": "esnext",
+        "moduleResolution": "node",
+        "resolveJsonModule": True,
+        "isolatedModules": True,
+        "noEmit": True,
+        "jsx": "react-jsx"
+    },
+    "include": ["src"],
+    "exclude": ["node_modules"]
+}, indent=2)
+
+_VUE_CONFIG = """
+module.exports = {
+    configureWebpack: {
+        // Vue.js specific configuration
+    }
+}
+"""
+
+_SVELTE_CONFIG = """
+import adapter from '@sveltejs/adapter-auto';
+
+export default {
+    kit: {
+        adapter: adapter()
+    }
+};
+"""
+
+_NEXTJS_CONFIG = """
+/** @type {import('next').NextConfig} */
+const nextConfig = {
+    reactStrictMode: true,
+    compiler: {
+        styledComponents: true
+    }
+}
+
+module.exports = nextConfig
+"""
+
+@dataclass(slots=True, frozen=True)
 class ComponentDefinition:
     name: str
     props: Dict[str, Any]
-    children: List['ComponentDefinition']
+    children: Tuple['ComponentDefinition', ...]
     styles: Dict[str, Any]
     framework_specific: Dict[str, Any]
 
+    def __post_init__(self):
+        # Callers may pass a list; store an immutable tuple either way
+        object.__setattr__(self, "children", tuple(self.children))
+
+def _node_digest(name: str, props: str, styles: str, child_digests: List[bytes]) -> bytes:
+    """Hash of exactly what render_node consumes, so equal digests render equally"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (name, props, styles):
+        encoded = part.encode()
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    for child_digest in child_digests:
+        digest.update(child_digest)
+    return digest.digest()
+
 class FrameworkAdapter(ABC):
-    @abstractmethod
     def generate_component(self, definition: ComponentDefinition) -> str:
-        """Generate framework-specific component code"""
+        """Generate framework-specific code for a component tree"""
+        # Post-order walk with an explicit stack so deep trees don't recurse.
+        # Each distinct subtree is hashed and queued once, in an order where
+        # children always come before their parents.
+        digests: Dict[int, bytes] = {}
+        pending: Dict[bytes, Tuple[ComponentDefinition, str, str, List[bytes]]] = {}
+        refcounts: Dict[bytes, int] = {}
+        expanding = set()
+        stack = [(definition, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if id(node) in digests:
+                continue
+
+            if not children_done:
+                if id(node) in expanding:
+                    raise ValueError(f"Component '{node.name}' contains itself")
+                expanding.add(id(node))
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children)
+                continue
+
+            props = self.generate_props(node.props)
+            styles = self.generate_styles(node.styles)
+            child_digests = [digests[id(child)] for child in node.children]
+            digest = _node_digest(node.name, props, styles, child_digests)
+            if digest not in pending:
+                pending[digest] = (node, props, styles, child_digests)
+                refcounts[digest] = 0
+                for child_digest in child_digests:
+                    refcounts[child_digest] += 1
+            digests[id(node)] = digest
+            expanding.discard(id(node))
+
+        # Render bottom-up, dropping each child's code once its last parent
+        # has used it so only the live frontier of the tree is held in memory
+        rendered: Dict[bytes, str] = {}
+        for digest, (node, props, styles, child_digests) in pending.items():
+            children = "".join(rendered[child_digest] for child_digest in child_digests)
+            rendered[digest] = self.render_node(node, props, styles, children)
+            for child_digest in child_digests:
+                refcounts[child_digest] -= 1
+                if not refcounts[child_digest]:
+                    del rendered[child_digest]
+
+        return rendered[digests[id(definition)]]
+
+    @abstractmethod
+    def render_node(
+        self,
+        definition: ComponentDefinition,
+        props: str,
+        styles: str,
+        children: str
+    ) -> str:
+        """Generate code for a single component from its rendered parts"""
         pass
 
     @abstractmethod
@@ -34,170 +198,158 @@ class FrameworkAdapter(ABC):
         """Generate framework-specific props"""
         pass
 
-class ReactAdapter(FrameworkAdapter):
-    def generate_component(self, definition: ComponentDefinition) -> str:
-        props = self.generate_props(definition.props)
-        styles = self.generate_styles(definition.styles)
-        children = [
-            self.generate_component(child)
-            for child in definition.children
-        ]
-
-        return f"""
+# React and Svelte templates are plain substitutions, so str.format_map is
+# enough; Jinja is kept for the remaining adapters
+_REACT_TEMPLATE = """
 import React from 'react';
 import styled from 'styled-components';
 
-const Styled{definition.name} = styled.div`
+const Styled{name} = styled.div`
     {styles}
 `;
 
-export const {definition.name} = ({props}) => {{
+export const {name} = ({props}) => {{
     return (
-        <Styled{definition.name} {...props}>
-            {{"".join(children)}}
-        </Styled{definition.name}>
+        <Styled{name} {{...props}}>
+            {children}
+        </Styled{name}>
     );
 }};
 """
 
-    def generate_styles(self, styles: Dict[str, Any]) -> str:
-        css_rules = []
-        for prop, value in styles.items():
-            css_rules.append(f"{prop}: {value};")
-        return "\n    ".join(css_rules)
-
-    def generate_props(self, props: Dict[str, Any]) -> str:
-        prop_list = []
-        for name, type_info in props.items():
-            prop_list.append(f"{name}: {type_info}")
-        return "{ " + ", ".join(prop_list) + " }"
-
-class VueAdapter(FrameworkAdapter):
-    def generate_component(self, definition: ComponentDefinition) -> str:
-        props = self.generate_props(definition.props)
-        styles = self.generate_styles(definition.styles)
-        children = [
-            self.generate_component(child)
-            for child in definition.children
-        ]
-
-        return f"""
-<template>
-    <div class="{definition.name.lower()}">
-        {"".join(children)}
-    </div>
-</template>
-
-<script>
-export default {{
-    name: '{definition.name}',
-    props: {props}
-}}
-</script>
-
-<style scoped>
-.{definition.name.lower()} {{
-    {styles}
-}}
-</style>
-"""
-
-    def generate_styles(self, styles: Dict[str, Any]) -> str:
-        css_rules = []
-        for prop, value in styles.items():
-            css_rules.append(f"    {prop}: {value};")
-        return "\n".join(css_rules)
-
-    def generate_props(self, props: Dict[str, Any]) -> str:
-        prop_list = []
-        for name, type_info in props.items():
-            prop_list.append(f"    {name}: {{ type: {type_info} }}")
-        return "{\n" + ",\n".join(prop_list) + "\n}"
-
-class SvelteAdapter(FrameworkAdapter):
-    def generate_component(self, definition: ComponentDefinition) -> str:
-        props = self.generate_props(definition.props)
-        styles = self.generate_styles(definition.styles)
-        children = [
-            self.generate_component(child)
-            for child in definition.children
-        ]
-
-        return f"""
+_SVELTE_TEMPLATE = """
 <script>
     {props}
 </script>
 
-<div class="{definition.name.lower()}">
-    {"".join(children)}
+<div class="{class_name}">
+    {children}
 </div>
 
 <style>
-    .{definition.name.lower()} {{
+    .{class_name} {{
         {styles}
     }}
 </style>
 """
 
+class ReactAdapter(FrameworkAdapter):
+    def render_node(
+        self,
+        definition: ComponentDefinition,
+        props: str,
+        styles: str,
+        children: str
+    ) -> str:
+        return _REACT_TEMPLATE.format_map({
+            "name": definition.name,
+            "props": props,
+            "styles": styles,
+            "children": children
+        })
+
     def generate_styles(self, styles: Dict[str, Any]) -> str:
-        css_rules = []
-        for prop, value in styles.items():
-            css_rules.append(f"        {prop}: {value};")
-        return "\n".join(css_rules)
+        return "\n    ".join(f"{prop}: {value};" for prop, value in styles.items())
 
     def generate_props(self, props: Dict[str, Any]) -> str:
-        prop_list = []
-        for name, type_info in props.items():
-            prop_list.append(f"export let {name};")
-        return "\n    ".join(prop_list)
+        return "{ " + ", ".join(f"{name}: {type_info}" for name, type_info in props.items()) + " }"
 
-class NextJSAdapter(FrameworkAdapter):
-    def generate_component(self, definition: ComponentDefinition) -> str:
-        props = self.generate_props(definition.props)
-        styles = self.generate_styles(definition.styles)
-        children = [
-            self.generate_component(child)
-            for child in definition.children
-        ]
+class VueAdapter(FrameworkAdapter):
+    def __init__(self):
+        self._template = _ENV.get_template("vue.jinja")
 
-        return f"""
-'use client';
+    def render_node(
+        self,
+        definition: ComponentDefinition,
+        props: str,
+        styles: str,
+        children: str
+    ) -> str:
+        return self._template.render(
+            name=definition.name,
+            props=props,
+            styles=styles,
+            children=children
+        )
 
-import styled from 'styled-components';
+    def generate_styles(self, styles: Dict[str, Any]) -> str:
+        return "\n".join(f"    {prop}: {value};" for prop, value in styles.items())
 
-const Styled{definition.name} = styled.div`
-    {styles}
-`;
+    def generate_props(self, props: Dict[str, Any]) -> str:
+        return "{\n" + ",\n".join(
+            f"    {name}: {{ type: {type_info} }}" for name, type_info in props.items()
+        ) + "\n}"
 
-export default function {definition.name}({props}) {{
-    return (
-        <Styled{definition.name}>
-            {{"".join(children)}}
-        </Styled{definition.name}>
-    );
-}}
-"""
+class SvelteAdapter(FrameworkAdapter):
+    def render_node(
+        self,
+        definition: ComponentDefinition,
+        props: str,
+        styles: str,
+        children: str
+    ) -> str:
+        return _SVELTE_TEMPLATE.format_map({
+            "class_name": definition.name.lower(),
+            "props": props,
+            "styles": styles,
+            "children": children
+        })
 
     def generate_styles(self, styles: Dict[str, Any]) -> str:
-        css_rules = []
-        for prop, value in styles.items():
-            css_rules.append(f"    {prop}: {value};")
-        return "\n".join(css_rules)
+        return "\n".join(f"        {prop}: {value};" for prop, value in styles.items())
 
     def generate_props(self, props: Dict[str, Any]) -> str:
-        prop_list = []
-        for name, type_info in props.items():
-            prop_list.append(f"{name}")
-        return "{ " + ", ".join(prop_list) + " }"
+        return "\n    ".join(f"export let {name};" for name in props)
 
-class UIGenerator:
+class NextJSAdapter(FrameworkAdapter):
     def __init__(self):
-        self.adapters = {
-            UIFramework.REACT: ReactAdapter(),
-            UIFramework.VUE: VueAdapter(),
-            UIFramework.SVELTE: SvelteAdapter(),
-            UIFramework.NEXTJS: NextJSAdapter()
-        }
+        self._template = _ENV.get_template("nextjs.jinja")
+
+    def render_node(
+        self,
+        definition: ComponentDefinition,
+        props: str,
+        styles: str,
+        children: str
+    ) -> str:
+        return self._template.render(
+            name=definition.name,
+            props=props,
+            styles=styles,
+            children=children
+        )
+
+    def generate_styles(self, styles: Dict[str, Any]) -> str:
+        return "\n".join(f"    {prop}: {value};" for prop, value in styles.items())
+
+    def generate_props(self, props: Dict[str, Any]) -> str:
+        return "{ " + ", ".join(f"{name}" for name in props) + " }"
+
+_ADAPTER_CLASSES: Dict[UIFramework, Type[FrameworkAdapter]] = {
+    UIFramework.REACT: ReactAdapter,
+    UIFramework.VUE: VueAdapter,
+    UIFramework.SVELTE: SvelteAdapter,
+    UIFramework.NEXTJS: NextJSAdapter
+}
+
+# Adapters are shared by every UIGenerator and built on first use, so
+# frameworks that are never requested never load their templates
+_ADAPTERS: Dict[UIFramework, FrameworkAdapter] = {}
+
+class UIGenerator:
+    _EXTENSIONS = {
+        UIFramework.REACT: "tsx",
+        UIFramework.VUE: "vue",
+        UIFramework.SVELTE: "svelte",
+        UIFramework.NEXTJS: "tsx"
+    }
+
+    _CONFIG_FILES = {
+        UIFramework.REACT: {"tsconfig.json": _REACT_TSCONFIG},
+        UIFramework.VUE: {"vue.config.js": _VUE_CONFIG},
+        UIFramework.SVELTE: {"svelte.config.js": _SVELTE_CONFIG},
+        UIFramework.NEXTJS: {"next.config.js": _NEXTJS_CONFIG}
+    }
 
     def generate_component(
         self,
@@ -205,9 +357,12 @@ class UIGenerator:
         framework: UIFramework
     ) -> str:
         """Generate component code for specified framework"""
-        adapter = self.adapters.get(framework)
-        if not adapter:
-            raise ValueError(f"Unsupported framework: {framework}")
+        adapter = _ADAPTERS.get(framework)
+        if adapter is None:
+            adapter_class = _ADAPTER_CLASSES.get(framework)
+            if adapter_class is None:
+                raise ValueError(f"Unsupported framework: {framework}")
+            adapter = _ADAPTERS.setdefault(framework, adapter_class())
         return adapter.generate_component(definition)
 
     def generate_project_structure(
@@ -218,12 +373,12 @@ class UIGenerator:
     ) -> Dict[str, str]:
         """Generate all project files for specified framework"""
         files = {}
+        extension = self._get_extension(framework)
         
         # Generate components
         for component in components:
             code = self.generate_component(component, framework)
-            filename = f"{component.name}.{self._get_extension(framework)}"
-            files[filename] = code
+            files[f"{component.name}.{extension}"] = code
 
         # Generate framework-specific config files
         config_files = self._generate_config_files(framework)
@@ -233,71 +388,8 @@ class UIGenerator:
 
     def _get_extension(self, framework: UIFramework) -> str:
         """Get file extension for framework"""
-        extensions = {
-            UIFramework.REACT: "tsx",
-            UIFramework.VUE: "vue",
-            UIFramework.SVELTE: "svelte",
-            UIFramework.NEXTJS: "tsx"
-        }
-        return extensions.get(framework, "tsx")
+        return self._EXTENSIONS.get(framework, "tsx")
 
     def _generate_config_files(self, framework: UIFramework) -> Dict[str, str]:
         """Generate framework-specific configuration files"""
-        configs = {}
-        
-        if framework == UIFramework.REACT:
-            configs["tsconfig.json"] = json.dumps({
-                "compilerOptions": {
-                    "target": "es5",
-                    "lib": ["dom", "dom.iterable", "esnext"],
-                    "allowJs": True,
-                    "skipLibCheck": True,
-                    "esModuleInterop": True,
-                    "allowSyntheticDefaultImports": True,
-                    "strict": True,
-                    "forceConsistentCasingInFileNames": True,
-                    "module": "esnext",
-                    "moduleResolution": "node",
-                    "resolveJsonModule": True,
-                    "isolatedModules": True,
-                    "noEmit": True,
-                    "jsx": "react-jsx"
-                },
-                "include": ["src"],
-                "exclude": ["node_modules"]
-            }, indent=2)
-
-        elif framework == UIFramework.VUE:
-            configs["vue.config.js"] = """
-module.exports = {
-    configureWebpack: {
-        // Vue.js specific configuration
-    }
-}
-"""
-
-        elif framework == UIFramework.SVELTE:
-            configs["svelte.config.js"] = """
-import adapter from '@sveltejs/adapter-auto';
-
-export default {
-    kit: {
-        adapter: adapter()
-    }
-};
-"""
-
-        elif framework == UIFramework.NEXTJS:
-            configs["next.config.js"] = """
-/** @type {import('next').NextConfig} */
-const nextConfig = {
-    reactStrictMode: true,
-    compiler: {
-        styledComponents: true
-    }
-}
-
-module.exports = nextConfig
-"""
-
-        return configs
+        return dict(self._CONFIG_FILES.get(framework, {}))
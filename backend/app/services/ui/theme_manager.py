@@ -1,15 +1,21 @@
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from io import StringIO
 from enum import Enum
-from typing import Dict, List, Optional, Any
-import json
+from typing import Dict, List, Optional, Any, Tuple
+import asyncio
 import os
 from pathlib import Path
 
+import aiofiles
+import orjson
+from immutables import Map
+
 class ColorScheme(Enum):
     LIGHT = "light"
     DARK = "dark"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ColorPalette:
     primary: str
     secondary: str
@@ -21,7 +27,7 @@ class ColorPalette:
     success: str
     info: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Typography:
     font_family: str
     font_size_base: str
@@ -29,13 +35,13 @@ class Typography:
     headings: Dict[str, Dict[str, str]]
     body: Dict[str, str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Spacing:
     unit: str
-    scale: List[str]
+    scale: Tuple[str, ...]
     custom: Dict[str, str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Breakpoints:
     xs: str
     sm: str
@@ -44,7 +50,7 @@ class Breakpoints:
     xl: str
     xxl: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Theme:
     name: str
     color_schemes: Dict[ColorScheme, ColorPalette]
@@ -53,19 +59,51 @@ class Theme:
     breakpoints: Breakpoints
     custom: Dict[str, Any]
 
+# Field names in declaration order, resolved once for the export loops
+_PALETTE_FIELDS = tuple(f.name for f in fields(ColorPalette))
+_BREAKPOINT_FIELDS = tuple(f.name for f in fields(Breakpoints))
+
 class ThemeManager:
-    def __init__(self, themes_dir: str):
+    def __init__(self, themes_dir: str, autoload: bool = True):
         self.themes_dir = Path(themes_dir)
         self.themes_dir.mkdir(parents=True, exist_ok=True)
-        self._load_themes()
+        # Copy-on-write map: readers see a consistent snapshot without locking,
+        # writers swap in a new map with a single assignment
+        self.themes: Map[str, Theme] = Map()
+        self._export_cache: Dict[Tuple[str, str], str] = {}
+        if autoload:
+            self._load_themes()
 
     def _load_themes(self):
         """Load all themes from the themes directory"""
-        self.themes = {}
-        for theme_file in self.themes_dir.glob("*.json"):
-            with open(theme_file, "r") as f:
-                theme_data = json.load(f)
-                self.themes[theme_data["name"]] = self._parse_theme(theme_data)
+        theme_files = list(self.themes_dir.glob("*.json"))
+
+        # Overlap file reads so cold start isn't the sum of every file's latency
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            theme_datas = list(executor.map(
+                lambda path: orjson.loads(path.read_bytes()), theme_files
+            ))
+
+        self._install_themes(theme_datas)
+
+    async def load_themes_async(self):
+        """Load all themes from the themes directory without blocking the event loop"""
+        async def read_theme(path: Path) -> Dict[str, Any]:
+            async with aiofiles.open(path, "rb") as f:
+                return orjson.loads(await f.read())
+
+        theme_files = list(self.themes_dir.glob("*.json"))
+        theme_datas = await asyncio.gather(*(read_theme(p) for p in theme_files))
+        self._install_themes(theme_datas)
+
+    def _install_themes(self, theme_datas: List[Dict[str, Any]]):
+        """Parse loaded theme data and swap it in as the current theme map"""
+        themes = {}
+        for theme_data in theme_datas:
+            themes[theme_data["name"]] = self._parse_theme(theme_data)
+
+        self.themes = Map(themes)
+        self._export_cache.clear()
 
     def _parse_theme(self, theme_data: Dict[str, Any]) -> Theme:
         """Parse theme data into Theme object"""
@@ -84,7 +122,7 @@ class ThemeManager:
 
         spacing = Spacing(
             unit=theme_data["spacing"]["unit"],
-            scale=theme_data["spacing"]["scale"],
+            scale=tuple(theme_data["spacing"]["scale"]),
             custom=theme_data["spacing"]["custom"]
         )
 
@@ -105,10 +143,10 @@ class ThemeManager:
         
         # Save theme to file
         theme_file = self.themes_dir / f"{theme.name}.json"
-        with open(theme_file, "w") as f:
-            json.dump(theme_data, f, indent=2)
+        theme_file.write_bytes(orjson.dumps(theme_data, option=orjson.OPT_INDENT_2))
         
-        self.themes[theme.name] = theme
+        self.themes = self.themes.set(theme.name, theme)
+        self._invalidate_exports(theme.name)
         return theme
 
     def get_theme(self, name: str) -> Optional[Theme]:
@@ -124,10 +162,10 @@ class ThemeManager:
         
         # Update theme file
         theme_file = self.themes_dir / f"{name}.json"
-        with open(theme_file, "w") as f:
-            json.dump(theme_data, f, indent=2)
+        theme_file.write_bytes(orjson.dumps(theme_data, option=orjson.OPT_INDENT_2))
         
-        self.themes[name] = theme
+        self.themes = self.themes.set(name, theme)
+        self._invalidate_exports(name)
         return theme
 
     def delete_theme(self, name: str):
@@ -137,88 +175,110 @@ class ThemeManager:
         
         theme_file = self.themes_dir / f"{name}.json"
         theme_file.unlink()
-        del self.themes[name]
+        self.themes = self.themes.delete(name)
+        self._invalidate_exports(name)
+
+    def _invalidate_exports(self, name: str):
+        """Drop cached exports for a theme after it changes"""
+        self._export_cache.pop((name, "css"), None)
+        self._export_cache.pop((name, "scss"), None)
 
     def export_theme(self, name: str, format: str = "css") -> str:
         """Export theme in specified format"""
+        cached = self._export_cache.get((name, format))
+        if cached is not None:
+            return cached
+
         theme = self.get_theme(name)
         if not theme:
             raise ValueError(f"Theme '{name}' not found")
 
         if format == "css":
-            return self._export_css(theme)
+            exported = self._export_css(theme)
         elif format == "scss":
-            return self._export_scss(theme)
+            exported = self._export_scss(theme)
         else:
             raise ValueError(f"Unsupported format: {format}")
 
+        self._export_cache[(name, format)] = exported
+        return exported
+
     def _export_css(self, theme: Theme) -> str:
         """Export theme as CSS variables"""
-        css = []
-        
-        # Root variables
-        css.append(":root {")
-        
+        typography = theme.typography
+        spacing = theme.spacing
+        breakpoints = theme.breakpoints
+
         # Colors
-        for scheme, palette in theme.color_schemes.items():
-            for color_name, color_value in palette.__dict__.items():
-                css.append(f"  --color-{scheme.value}-{color_name}: {color_value};")
-        
+        color_lines = [
+            f"  --color-{scheme.value}-{color_name}: {getattr(palette, color_name)};"
+            for scheme, palette in theme.color_schemes.items()
+            for color_name in _PALETTE_FIELDS
+        ]
+
         # Typography
-        css.append(f"  --font-family: {theme.typography.font_family};")
-        css.append(f"  --font-size-base: {theme.typography.font_size_base};")
-        css.append(f"  --line-height-base: {theme.typography.line_height_base};")
-        
-        for heading, props in theme.typography.headings.items():
-            for prop_name, prop_value in props.items():
-                css.append(f"  --typography-{heading}-{prop_name}: {prop_value};")
-        
+        typography_lines = [
+            f"  --font-family: {typography.font_family};",
+            f"  --font-size-base: {typography.font_size_base};",
+            f"  --line-height-base: {typography.line_height_base};",
+            *(
+                f"  --typography-{heading}-{prop_name}: {prop_value};"
+                for heading, props in typography.headings.items()
+                for prop_name, prop_value in props.items()
+            )
+        ]
+
         # Spacing
-        css.append(f"  --spacing-unit: {theme.spacing.unit};")
-        for i, value in enumerate(theme.spacing.scale):
-            css.append(f"  --spacing-{i}: {value};")
-        
+        spacing_lines = [
+            f"  --spacing-unit: {spacing.unit};",
+            *(f"  --spacing-{i}: {value};" for i, value in enumerate(spacing.scale))
+        ]
+
         # Breakpoints
-        for breakpoint, value in theme.breakpoints.__dict__.items():
-            css.append(f"  --breakpoint-{breakpoint}: {value};")
-        
-        css.append("}")
-        
-        return "\n".join(css)
+        breakpoint_lines = [
+            f"  --breakpoint-{breakpoint}: {getattr(breakpoints, breakpoint)};"
+            for breakpoint in _BREAKPOINT_FIELDS
+        ]
+
+        return ":root {\n" + "\n".join(
+            color_lines + typography_lines + spacing_lines + breakpoint_lines
+        ) + "\n}"
 
     def _export_scss(self, theme: Theme) -> str:
         """Export theme as SCSS variables"""
-        scss = []
+        buf = StringIO()
+        write = buf.write
         
         # Colors
         for scheme, palette in theme.color_schemes.items():
-            for color_name, color_value in palette.__dict__.items():
-                scss.append(f"$color-{scheme.value}-{color_name}: {color_value};")
+            for color_name in _PALETTE_FIELDS:
+                write(f"$color-{scheme.value}-{color_name}: {getattr(palette, color_name)};\n")
         
         # Typography
-        scss.append(f"$font-family: {theme.typography.font_family};")
-        scss.append(f"$font-size-base: {theme.typography.font_size_base};")
-        scss.append(f"$line-height-base: {theme.typography.line_height_base};")
+        write(f"$font-family: {theme.typography.font_family};\n")
+        write(f"$font-size-base: {theme.typography.font_size_base};\n")
+        write(f"$line-height-base: {theme.typography.line_height_base};\n")
         
-        scss.append("$typography: (")
+        write("$typography: (\n")
         for heading, props in theme.typography.headings.items():
-            scss.append(f"  {heading}: (")
+            write(f"  {heading}: (\n")
             for prop_name, prop_value in props.items():
-                scss.append(f"    {prop_name}: {prop_value},")
-            scss.append("  ),")
-        scss.append(");")
+                write(f"    {prop_name}: {prop_value},\n")
+            write("  ),\n")
+        write(");\n")
         
         # Spacing
-        scss.append(f"$spacing-unit: {theme.spacing.unit};")
-        scss.append("$spacing: (")
+        write(f"$spacing-unit: {theme.spacing.unit};\n")
+        write("$spacing: (\n")
         for i, value in enumerate(theme.spacing.scale):
-            scss.append(f"  {i}: {value},")
-        scss.append(");")
+            write(f"  {i}: {value},\n")
+        write(");\n")
         
         # Breakpoints
-        scss.append("$breakpoints: (")
-        for breakpoint, value in theme.breakpoints.__dict__.items():
-            scss.append(f"  {breakpoint}: {value},")
-        scss.append(");")
+        write("$breakpoints: (\n")
+        breakpoints = theme.breakpoints
+        for breakpoint in _BREAKPOINT_FIELDS:
+            write(f"  {breakpoint}: {getattr(breakpoints, breakpoint)},\n")
+        write(");")
         
-        return "\n".join(scss)
+        return buf.getvalue()
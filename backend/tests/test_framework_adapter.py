@@ -0,0 +1,93 @@
+import sys
+
+from app.services.ui.framework_adapter import (
+    ComponentDefinition,
+    ReactAdapter,
+    UIFramework,
+    UIGenerator
+)
+
+def _component(props):
+    return ComponentDefinition(
+        name="Card",
+        props=props,
+        children=(),
+        styles={},
+        framework_specific={}
+    )
+
+def test_props_that_serialize_alike_are_not_shared_in_cache():
+    generator = UIGenerator()
+    for first, second, expected in (
+        ({"v": (1, 2)}, {"v": [1, 2]}, "{ v: [1, 2] }"),
+        ({"v": True}, {"v": "true"}, "{ v: true }"),
+        ({True: "x"}, {"true": "x"}, "{ true: x }"),
+    ):
+        generator.generate_component(_component(first), UIFramework.REACT)
+        code = generator.generate_component(_component(second), UIFramework.REACT)
+        assert expected in code
+
+def test_mixed_type_prop_keys_render():
+    code = UIGenerator().generate_component(
+        _component({1: "a", "b": "c"}), UIFramework.REACT
+    )
+    assert "{ 1: a, b: c }" in code
+
+def test_children_are_stored_as_tuple():
+    child = _component({})
+    parent = ComponentDefinition(
+        name="List",
+        props={},
+        children=[child, child],
+        styles={},
+        framework_specific={}
+    )
+    assert parent.children == (child, child)
+
+def test_tree_deeper_than_recursion_limit_renders():
+    node = _component({})
+    depth = sys.getrecursionlimit() + 100
+    for _ in range(depth):
+        node = ComponentDefinition(
+            name="Wrapper",
+            props={},
+            children=(node,),
+            styles={},
+            framework_specific={}
+        )
+
+    code = UIGenerator().generate_component(node, UIFramework.SVELTE)
+    assert code.count('<div class="wrapper">') == depth
+    assert code.count('<div class="card">') == 1
+
+def test_shared_subtree_renders_once_but_appears_everywhere():
+    adapter = ReactAdapter()
+    render_node = adapter.render_node
+    rendered_names = []
+
+    def counting_render_node(definition, props, styles, children):
+        rendered_names.append(definition.name)
+        return render_node(definition, props, styles, children)
+
+    adapter.render_node = counting_render_node
+    card = _component({"title": "string"})
+    row = ComponentDefinition(
+        name="Row",
+        props={},
+        children=(card, _component({"title": "string"})),
+        styles={},
+        framework_specific={}
+    )
+    grid = ComponentDefinition(
+        name="Grid",
+        props={},
+        children=(row, row, card),
+        styles={},
+        framework_specific={}
+    )
+
+    code = adapter.generate_component(grid)
+    assert rendered_names.count("Card") == 1
+    assert rendered_names.count("Row") == 1
+    assert code.count("export const Card") == 5
+    assert code.count("export const Row") == 2
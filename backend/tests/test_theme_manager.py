@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from app.services.ui.theme_manager import ThemeManager
+
+_COLORS = (
+    "primary", "secondary", "accent", "background", "text",
+    "error", "warning", "success", "info"
+)
+
+def _theme_data(name="base", font_family="Inter"):
+    return {
+        "name": name,
+        "color_schemes": {
+            "light": {color: "#ffffff" for color in _COLORS},
+            "dark": {color: "#000000" for color in _COLORS}
+        },
+        "typography": {
+            "font_family": font_family,
+            "font_size_base": "16px",
+            "line_height_base": "1.5",
+            "headings": {"h1": {"size": "2em", "weight": "700"}},
+            "body": {"size": "1em"}
+        },
+        "spacing": {"unit": "4px", "scale": ["0", "4px", "8px"], "custom": {}},
+        "breakpoints": {
+            "xs": "0", "sm": "576px", "md": "768px",
+            "lg": "992px", "xl": "1200px", "xxl": "1400px"
+        }
+    }
+
+@pytest.mark.parametrize("format", ["css", "scss"])
+def test_export_reflects_update(tmp_path, format):
+    manager = ThemeManager(str(tmp_path))
+    manager.create_theme(_theme_data())
+    assert "Inter" in manager.export_theme("base", format)
+
+    manager.update_theme("base", _theme_data(font_family="Roboto"))
+    exported = manager.export_theme("base", format)
+    assert "Roboto" in exported
+    assert "Inter" not in exported
+
+@pytest.mark.parametrize("format", ["css", "scss"])
+def test_export_raises_after_delete(tmp_path, format):
+    manager = ThemeManager(str(tmp_path))
+    manager.create_theme(_theme_data())
+    manager.export_theme("base", format)
+
+    manager.delete_theme("base")
+    with pytest.raises(ValueError):
+        manager.export_theme("base", format)
+
+def test_async_load_matches_sync_load(tmp_path):
+    writer = ThemeManager(str(tmp_path))
+    writer.create_theme(_theme_data("base"))
+    writer.create_theme(_theme_data("brand", font_family="Roboto"))
+
+    sync_manager = ThemeManager(str(tmp_path))
+    async_manager = ThemeManager(str(tmp_path), autoload=False)
+    assert len(async_manager.themes) == 0
+
+    asyncio.run(async_manager.load_themes_async())
+    assert dict(async_manager.themes) == dict(sync_manager.themes)
+    assert set(async_manager.themes) == {"base", "brand"}